@@ -1,6 +1,14 @@
+import re
+from pathlib import Path
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
+
+DATA_DIR = Path("data")
+MAX_HEATMAP_SIZE = 30
+MAX_HOVER_COMMENT_CHARS = 120
 
 # Page configuration
 st.set_page_config(
@@ -10,9 +18,10 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Custom CSS for better styling
-st.markdown(
-    """
+# Custom CSS for better styling. Streamlit removes elements a rerun doesn't
+# re-emit, so this can't be sent once per session; collapsing the whitespace
+# keeps the per-rerun payload small instead.
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -38,66 +47,119 @@ st.markdown(
         font-size: 0.9rem;
         opacity: 0.9;
     }
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-    }
-    .stTabs [data-baseweb="tab"] {
-        height: 50px;
-        white-space: pre-wrap;
-        background-color: #f0f2f6;
-        border-radius: 4px 4px 0px 0px;
-        gap: 1px;
-        padding-top: 10px;
-        padding-bottom: 10px;
-    }
-    .stTabs [aria-selected="true"] {
-        background-color: #1f77b4;
-        color: white;
-    }
 </style>
-""",
-    unsafe_allow_html=True,
-)
+"""
+st.markdown(re.sub(r"\s+", " ", CUSTOM_CSS).strip(), unsafe_allow_html=True)
+
+
+def read_table(name, columns, dtype=None, parse_dates=None):
+    """Read a data table, preferring an up-to-date Parquet copy over the CSV"""
+    csv_path = DATA_DIR / f"{name}.csv"
+    parquet_path = csv_path.with_suffix(".parquet")
+    if parquet_path.exists() and (
+        not csv_path.exists()
+        or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime
+    ):
+        # Parquet copies already store timestamps typed
+        df = pd.read_parquet(parquet_path, columns=columns)
+        return df.astype(dtype) if dtype else df
+    return pd.read_csv(csv_path, usecols=columns, dtype=dtype, parse_dates=parse_dates)
 
 
 @st.cache_data
 def load_data():
-    """Load and preprocess all CSV data"""
+    """Load and preprocess all league data"""
     try:
-        # Load data
-        competitors = pd.read_csv("data/competitors.csv")
-        rounds = pd.read_csv("data/rounds.csv")
-        submissions = pd.read_csv("data/submissions.csv")
-        votes = pd.read_csv("data/votes.csv")
+        # Load data, reading only the columns the dashboard uses and storing
+        # repeated ID/name keys as categoricals before merging
+        competitors = read_table(
+            "competitors", ["ID", "Name"], dtype={"ID": "category", "Name": "category"}
+        )
+        rounds = read_table(
+            "rounds", ["ID", "Name"], dtype={"ID": "category", "Name": "category"}
+        )
+        submissions = read_table(
+            "submissions",
+            [
+                "Spotify URI",
+                "Title",
+                "Artist(s)",
+                "Submitter ID",
+                "Comment",
+                "Round ID",
+            ],
+            dtype={
+                "Artist(s)": "category",
+                "Submitter ID": "category",
+                "Round ID": "category",
+            },
+        )
+        votes = read_table(
+            "votes",
+            ["Spotify URI", "Voter ID", "Round ID", "Points Assigned", "Created"],
+            dtype={
+                "Voter ID": "category",
+                "Round ID": "category",
+                "Points Assigned": "int16",
+            },
+            parse_dates=["Created"],
+        )
 
-        # Convert dates
-        rounds["Created"] = pd.to_datetime(rounds["Created"])
-        submissions["Created"] = pd.to_datetime(submissions["Created"])
-        votes["Created"] = pd.to_datetime(votes["Created"])
+        # Flag non-empty comments once so views can reuse the mask
+        submissions["has_comment"] = submissions["Comment"].notna() & (
+            submissions["Comment"] != ""
+        )
+        submissions["comment_length"] = (
+            submissions["Comment"].str.len().fillna(0).astype("int32")
+        )
 
         # Merge data for analysis
         submissions_with_rounds = submissions.merge(
-            rounds[["ID", "Name"]],
-            left_on="Round ID",
-            right_on="ID",
-            suffixes=("", "_round"),
+            rounds[["ID", "Name"]].rename(
+                columns={"ID": "Round ID", "Name": "Round Name"}
+            ),
+            on="Round ID",
+            how="left",
+            validate="m:1",
         )
 
         votes_with_submissions = votes.merge(
-            submissions_with_rounds[
-                ["Spotify URI", "Title", "Artist(s)", "Round ID", "Name", "Comment"]
-            ],
+            submissions_with_rounds[["Spotify URI", "Round Name"]],
             on="Spotify URI",
-            suffixes=("", "_submission"),
+            how="left",
+            validate="m:1",
         )
 
         votes_with_voters = votes_with_submissions.merge(
-            competitors[["ID", "Name"]],
-            left_on="Voter ID",
-            right_on="ID",
-            suffixes=("", "_voter"),
+            competitors[["ID", "Name"]].rename(
+                columns={"ID": "Voter ID", "Name": "Voter Name"}
+            ),
+            on="Voter ID",
+            how="left",
+            validate="m:1",
         )
 
+        votes_with_submitter = votes.merge(
+            submissions[["Spotify URI", "Submitter ID"]],
+            on="Spotify URI",
+            how="left",
+            validate="m:1",
+        )
+
+        # Top artists don't depend on the filters, so count them once
+        top_artists_df = (
+            submissions["Artist(s)"]
+            .value_counts()
+            .head(10)
+            .rename_axis("Artist")
+            .reset_index(name="Count")
+        )
+
+        # Lookup tables for resolving sidebar selections and voter names
+        round_id_by_name = dict(zip(rounds["Name"], rounds["ID"]))
+        competitor_id_by_name = dict(zip(competitors["Name"], competitors["ID"]))
+        competitor_name_by_id = dict(zip(competitors["ID"], competitors["Name"]))
+
         return (
             competitors,
             rounds,
@@ -105,785 +167,901 @@ def load_data():
             votes,
             votes_with_voters,
             submissions_with_rounds,
+            votes_with_submitter,
+            round_id_by_name,
+            competitor_id_by_name,
+            competitor_name_by_id,
+            top_artists_df,
         )
 
     except Exception as e:
         st.error(f"Error loading data: {e}")
-        return None, None, None, None, None, None
-
-
-def main():
-    # Header
-    st.markdown(
-        '<h1 class="main-header">🎵 Lo Fi Peeps Music League Analytics</h1>',
-        unsafe_allow_html=True,
+        return (None,) * 11
+
+
+@st.cache_resource
+def load_votes_index():
+    """Index votes by the sidebar filter keys for fast slicing"""
+    # cache_resource returns the same frame on every rerun instead of unpickling
+    # a copy like cache_data would, so callers must not mutate it
+    votes_with_voters = load_data()[4]
+    # Keep each row's original position so slices can be put back in order
+    return (
+        votes_with_voters.rename_axis("Row")
+        .reset_index()
+        .set_index(["Round ID", "Voter ID"])
+        .sort_index()
     )
 
-    # Load data
-    (
-        competitors,
-        rounds,
-        submissions,
-        votes,
-        votes_with_voters,
-        submissions_with_rounds,
-    ) = load_data()
-
-    if competitors is None:
-        st.error("Failed to load data. Please check your CSV files.")
-        return
 
-    # Sidebar filters
-    st.sidebar.header("📊 Filters")
-
-    # Round filter
-    round_names = ["All Rounds"] + rounds["Name"].tolist()
-    selected_round = st.sidebar.selectbox("Select Round", round_names)
-
-    # Competitor filter
-    competitor_names = ["All Competitors"] + competitors["Name"].tolist()
-    selected_competitor = st.sidebar.selectbox("Select Competitor", competitor_names)
-
-    # Apply filters
-    if selected_round != "All Rounds":
-        round_id = rounds[rounds["Name"] == selected_round]["ID"].iloc[0]
-        filtered_votes = votes_with_voters[votes_with_voters["Round ID"] == round_id]
-        filtered_submissions = submissions_with_rounds[
-            submissions_with_rounds["Round ID"] == round_id
-        ]
-    else:
-        filtered_votes = votes_with_voters
-        filtered_submissions = submissions_with_rounds
+def shorten_comments(df):
+    """Trim comments so chart hover text stays small"""
+    return df.assign(
+        Comment=df["Comment"].fillna("").str.slice(0, MAX_HOVER_COMMENT_CHARS)
+    )
 
-    if selected_competitor != "All Competitors":
-        competitor_id = competitors[competitors["Name"] == selected_competitor][
-            "ID"
-        ].iloc[0]
-        filtered_votes = filtered_votes[filtered_votes["Voter ID"] == competitor_id]
-        filtered_submissions = filtered_submissions[
-            filtered_submissions["Submitter ID"] == competitor_id
-        ]
 
-    # Main content tabs
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(
-        [
-            "📈 Overview",
-            "🗳️ Voting Patterns",
-            "💬 Comments Analysis",
-            "🎯 Round Insights",
-            "👥 Competitor Stats",
-        ]
+def build_bar_fig(
+    df,
+    x,
+    y,
+    title,
+    colorscale,
+    color=None,
+    orientation="v",
+    height=400,
+    hover_data=None,
+):
+    """Build a color-scaled bar chart from an already-aggregated frame"""
+    color = color or (x if orientation == "h" else y)
+    hovertemplate = f"{y}=%{{y}}<br>{x}=%{{x}}"
+    if color not in (x, y):
+        hovertemplate += f"<br>{color}=%{{marker.color}}"
+    for i, col in enumerate(hover_data or []):
+        hovertemplate += f"<br>{col}=%{{customdata[{i}]}}"
+
+    fig = go.Figure(
+        go.Bar(
+            x=df[x],
+            y=df[y],
+            orientation=orientation,
+            marker=dict(
+                color=df[color],
+                colorscale=colorscale,
+                showscale=True,
+                colorbar=dict(title=color),
+            ),
+            customdata=df[hover_data] if hover_data else None,
+            hovertemplate=hovertemplate + "<extra></extra>",
+        )
     )
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title=y, height=height)
+    if orientation == "v":
+        fig.update_layout(xaxis_tickangle=-45)
+    return fig
 
-    with tab1:
-        st.header("📊 League Overview")
 
-        # Key metrics
-        col1, col2, col3, col4 = st.columns(4)
+def build_histogram_fig(values, title, nbins, color, x_title):
+    """Build a single-color histogram of a numeric series"""
+    fig = go.Figure(go.Histogram(x=values, nbinsx=nbins, marker_color=color))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title="count", height=400)
+    return fig
 
-        with col1:
-            st.markdown(
-                f"""
-            <div class="metric-card">
-                <div class="metric-value">{len(rounds)}</div>
-                <div class="metric-label">Total Rounds</div>
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
 
-        with col2:
-            st.markdown(
-                f"""
-            <div class="metric-card">
-                <div class="metric-value">{len(competitors)}</div>
-                <div class="metric-label">Active Competitors</div>
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
+def select_votes(votes_indexed, round_id=None, voter_id=None):
+    """Slice the (Round ID, Voter ID)-indexed votes, empty when nothing matches"""
+    try:
+        if round_id is not None and voter_id is not None:
+            selected = votes_indexed.loc[[(round_id, voter_id)]]
+        elif round_id is not None:
+            selected = votes_indexed.xs(round_id, level="Round ID", drop_level=False)
+        else:
+            selected = votes_indexed.xs(voter_id, level="Voter ID", drop_level=False)
+    except KeyError:
+        selected = votes_indexed.iloc[:0]
+    return selected.reset_index().sort_values("Row").set_index("Row").rename_axis(None)
+
+
+def render_overview(
+    competitors, rounds, submissions, votes, submissions_with_rounds, top_artists_df
+):
+    """Render the league overview section"""
+    st.header("📊 League Overview")
+
+    # Key metrics
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.markdown(
+            f"""
+        <div class="metric-card">
+            <div class="metric-value">{len(rounds)}</div>
+            <div class="metric-label">Total Rounds</div>
+        </div>
+        """,
+            unsafe_allow_html=True,
+        )
 
-        with col3:
-            st.markdown(
-                f"""
-            <div class="metric-card">
-                <div class="metric-value">{len(submissions)}</div>
-                <div class="metric-label">Total Submissions</div>
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
+    with col2:
+        st.markdown(
+            f"""
+        <div class="metric-card">
+            <div class="metric-value">{len(competitors)}</div>
+            <div class="metric-label">Active Competitors</div>
+        </div>
+        """,
+            unsafe_allow_html=True,
+        )
 
-        with col4:
-            st.markdown(
-                f"""
-            <div class="metric-card">
-                <div class="metric-value">{len(votes)}</div>
-                <div class="metric-label">Total Votes Cast</div>
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
+    with col3:
+        st.markdown(
+            f"""
+        <div class="metric-card">
+            <div class="metric-value">{len(submissions)}</div>
+            <div class="metric-label">Total Submissions</div>
+        </div>
+        """,
+            unsafe_allow_html=True,
+        )
 
-        # Charts row 1
-        col1, col2 = st.columns(2)
+    with col4:
+        st.markdown(
+            f"""
+        <div class="metric-card">
+            <div class="metric-value">{len(votes)}</div>
+            <div class="metric-label">Total Votes Cast</div>
+        </div>
+        """,
+            unsafe_allow_html=True,
+        )
 
-        with col1:
-            # Submissions per round
-            submissions_per_round = (
-                submissions_with_rounds.groupby("Name").size().reset_index(name="Count")
-            )
-            fig = px.bar(
+    # Charts row 1
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Submissions per round
+        submissions_per_round = (
+            submissions_with_rounds.groupby("Round Name", observed=True, sort=False)
+            .size()
+            .reset_index(name="Count")
+        )
+        st.plotly_chart(
+            build_bar_fig(
                 submissions_per_round,
-                x="Name",
+                x="Round Name",
                 y="Count",
                 title="Submissions per Round",
-                color="Count",
-                color_continuous_scale="viridis",
-            )
-            fig.update_layout(xaxis_tickangle=-45, height=400)
-            st.plotly_chart(fig, use_container_width=True)
-
-        with col2:
-            # Voting activity over time
-            votes_over_time = (
-                votes.groupby(votes["Created"].dt.date).size().reset_index(name="Votes")
-            )
-            votes_over_time["Date"] = pd.to_datetime(votes_over_time["Created"])
-            fig = px.line(
-                votes_over_time,
-                x="Date",
-                y="Votes",
-                title="Voting Activity Over Time",
-                markers=True,
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+                colorscale="viridis",
+            ),
+            use_container_width=True,
+        )
 
-        # Charts row 2
-        col1, col2 = st.columns(2)
+    with col2:
+        # Voting activity over time
+        # Bucket by week or month on long leagues to keep the series small
+        span_days = (votes["Created"].max() - votes["Created"].min()).days
+        freq = "D" if span_days < 90 else "W" if span_days < 730 else "MS"
+        votes_over_time = (
+            votes.set_index("Created")
+            .resample(freq)
+            .size()
+            .rename_axis("Date")
+            .reset_index(name="Votes")
+        )
+        fig = px.line(
+            votes_over_time,
+            x="Date",
+            y="Votes",
+            title="Voting Activity Over Time",
+            markers=True,
+        )
+        fig.update_layout(height=400)
+        st.plotly_chart(fig, use_container_width=True)
 
-        with col1:
-            # Points distribution
-            fig = px.histogram(
-                votes,
-                x="Points Assigned",
-                title="Distribution of Points Assigned",
-                nbins=10,
-                color_discrete_sequence=["#1f77b4"],
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+    # Charts row 2
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Points distribution
+        st.plotly_chart(
+            build_histogram_fig(
+                votes["Points Assigned"],
+                "Distribution of Points Assigned",
+                10,
+                "#1f77b4",
+                "Points Assigned",
+            ),
+            use_container_width=True,
+        )
 
-        with col2:
-            # Top artists
-            top_artists = submissions["Artist(s)"].value_counts().head(10)
-            # Convert to dataframe for Plotly
-            top_artists_df = pd.DataFrame(
-                {"Artist": top_artists.index, "Count": top_artists.values}
-            )
-            fig = px.bar(
+    with col2:
+        # Top artists
+        st.plotly_chart(
+            build_bar_fig(
                 top_artists_df,
                 x="Count",
                 y="Artist",
-                orientation="h",
                 title="Top 10 Artists by Submissions",
-                color="Count",
-                color_continuous_scale="plasma",
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+                colorscale="plasma",
+                orientation="h",
+            ),
+            use_container_width=True,
+        )
 
-    with tab2:
-        st.header("🗳️ Voting Patterns Analysis")
 
-        # Voting behavior insights
-        col1, col2 = st.columns(2)
+def render_voting_patterns(filtered_votes, votes_with_voters, selected_round):
+    """Render the voting patterns section"""
+    st.header("🗳️ Voting Patterns Analysis")
 
-        with col1:
-            # Average points per voter
-            avg_points_per_voter = (
-                filtered_votes.groupby("Name_voter")["Points Assigned"]
-                .mean()
-                .sort_values(ascending=False)
-            )
-            # Convert to dataframe for Plotly
-            avg_points_df = pd.DataFrame(
-                {
-                    "Voter": avg_points_per_voter.index,
-                    "Avg_Points": avg_points_per_voter.values,
-                }
-            )
-            fig = px.bar(
+    # Voting behavior insights
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Average points per voter
+        avg_points_per_voter = (
+            filtered_votes.groupby("Voter Name", observed=True, sort=False)[
+                "Points Assigned"
+            ]
+            .mean()
+            .sort_values(ascending=False)
+        )
+        # Convert to dataframe for Plotly
+        avg_points_df = pd.DataFrame(
+            {
+                "Voter": avg_points_per_voter.index,
+                "Avg_Points": avg_points_per_voter.values,
+            }
+        )
+        st.plotly_chart(
+            build_bar_fig(
                 avg_points_df,
                 x="Avg_Points",
                 y="Voter",
-                orientation="h",
                 title="Average Points per Voter",
-                color="Avg_Points",
-                color_continuous_scale="viridis",
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+                colorscale="viridis",
+                orientation="h",
+            ),
+            use_container_width=True,
+        )
 
-        with col2:
-            # Voting consistency (standard deviation)
-            voting_consistency = (
-                filtered_votes.groupby("Name_voter")["Points Assigned"]
-                .agg(["mean", "std"])
-                .reset_index()
-            )
-            voting_consistency["std"] = voting_consistency["std"].fillna(0)
-            fig = px.scatter(
-                voting_consistency,
-                x="mean",
-                y="std",
-                title="Voting Consistency (Mean vs Standard Deviation)",
-                hover_data=["Name_voter"],
-                labels={"mean": "Average Points", "std": "Standard Deviation"},
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+    with col2:
+        # Voting consistency (population standard deviation, 0 for a single vote)
+        voter_points = filtered_votes.groupby("Voter Name", observed=True, sort=False)[
+            "Points Assigned"
+        ]
+        voting_consistency = pd.DataFrame(
+            {"mean": voter_points.mean(), "std": voter_points.std(ddof=0)}
+        ).reset_index()
+        fig = px.scatter(
+            voting_consistency,
+            x="mean",
+            y="std",
+            title="Voting Consistency (Mean vs Standard Deviation)",
+            hover_data=["Voter Name"],
+            labels={"mean": "Average Points", "std": "Standard Deviation"},
+        )
+        fig.update_layout(height=400)
+        st.plotly_chart(fig, use_container_width=True)
 
-        # Heatmap of voting patterns
-        st.subheader("🔥 Voting Pattern Heatmap")
+    # Heatmap of voting patterns
+    st.subheader("🔥 Voting Pattern Heatmap")
 
-        # Create voting matrix
-        voting_matrix = filtered_votes.pivot_table(
-            index="Name_voter",
-            columns="Name",
-            values="Points Assigned",
-            aggfunc="mean",
-            fill_value=0,
-        )
+    # Create voting matrix, leaving rounds a voter skipped as NaN (blank cells)
+    voting_matrix = (
+        filtered_votes.groupby(["Voter Name", "Round Name"], observed=True, sort=False)[
+            "Points Assigned"
+        ]
+        .mean()
+        .unstack()
+    )
 
-        fig = px.imshow(
-            voting_matrix,
-            title="Voting Pattern Heatmap (Average Points)",
-            color_continuous_scale="RdBu",
-            aspect="auto",
+    # Keep the heatmap readable on large leagues by clipping to the top rows/columns
+    top_voters = voting_matrix.sum(axis=1).nlargest(MAX_HEATMAP_SIZE).index
+    top_rounds = voting_matrix.sum(axis=0).nlargest(MAX_HEATMAP_SIZE).index
+    voting_matrix = voting_matrix.loc[
+        voting_matrix.index.isin(top_voters), voting_matrix.columns.isin(top_rounds)
+    ]
+
+    fig = px.imshow(
+        voting_matrix,
+        title="Voting Pattern Heatmap (Average Points)",
+        color_continuous_scale="RdBu",
+        aspect="auto",
+        zmin=voting_matrix.min().min(),
+        zmax=voting_matrix.max().max(),
+    )
+    fig.update_layout(height=500)
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Points distribution by round
+    if selected_round == "All Rounds":
+        st.subheader("📊 Points Distribution by Round")
+        points_by_round = (
+            votes_with_voters.groupby("Round Name", observed=True, sort=False)[
+                "Points Assigned"
+            ]
+            .agg(["mean", "count"])
+            .reset_index()
         )
-        fig.update_layout(height=500)
+        points_by_round.columns = ["Round", "Average Points", "Total Votes"]
+
+        fig = px.scatter(
+            points_by_round,
+            x="Total Votes",
+            y="Average Points",
+            title="Round Performance: Total Votes vs Average Points",
+            hover_data=["Round"],
+            size="Total Votes",
+            color="Average Points",
+            color_continuous_scale="plasma",
+        )
+        fig.update_layout(height=400)
         st.plotly_chart(fig, use_container_width=True)
 
-        # Points distribution by round
-        if selected_round == "All Rounds":
-            st.subheader("📊 Points Distribution by Round")
-            points_by_round = (
-                votes_with_voters.groupby("Name")["Points Assigned"]
-                .agg(["mean", "count"])
-                .reset_index()
-            )
-            points_by_round.columns = ["Round", "Average Points", "Total Votes"]
-
-            fig = px.scatter(
-                points_by_round,
-                x="Total Votes",
-                y="Average Points",
-                title="Round Performance: Total Votes vs Average Points",
-                hover_data=["Round"],
-                size="Total Votes",
-                color="Average Points",
-                color_continuous_scale="plasma",
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
 
-    with tab3:
-        st.header("💬 Comments Analysis")
+def render_comments(filtered_submissions, competitors):
+    """Render the comments analysis section"""
+    st.header("💬 Comments Analysis")
 
-        # Comment statistics
-        col1, col2, col3 = st.columns(3)
+    # Comment statistics
+    comment_lengths = filtered_submissions.loc[
+        filtered_submissions["has_comment"], "comment_length"
+    ]
+    col1, col2, col3 = st.columns(3)
 
-        with col1:
-            total_comments = len(
-                filtered_submissions[
-                    filtered_submissions["Comment"].notna()
-                    & (filtered_submissions["Comment"] != "")
-                ]
-            )
-            st.metric("Total Comments", total_comments)
+    with col1:
+        total_comments = int(filtered_submissions["has_comment"].sum())
+        st.metric("Total Comments", total_comments)
 
-        with col2:
-            comment_rate = (total_comments / len(filtered_submissions)) * 100
-            st.metric("Comment Rate", f"{comment_rate:.1f}%")
+    with col2:
+        comment_rate = (total_comments / len(filtered_submissions)) * 100
+        st.metric("Comment Rate", f"{comment_rate:.1f}%")
 
-        with col3:
-            avg_comment_length = (
-                filtered_submissions[
-                    filtered_submissions["Comment"].notna()
-                    & (filtered_submissions["Comment"] != "")
-                ]["Comment"]
-                .str.len()
-                .mean()
-            )
-            st.metric("Avg Comment Length", f"{avg_comment_length:.0f} chars")
+    with col3:
+        avg_comment_length = comment_lengths.mean()
+        st.metric("Avg Comment Length", f"{avg_comment_length:.0f} chars")
 
-        # Comment patterns
-        col1, col2 = st.columns(2)
+    # Comment patterns
+    col1, col2 = st.columns(2)
 
-        with col1:
-            # Comments per round
-            comments_per_round = (
-                filtered_submissions.groupby("Name")
-                .agg(Comment_Count=("Comment", lambda x: (x.notna() & (x != "")).sum()))
-                .reset_index()
-            )
+    with col1:
+        # Comments per round
+        comments_per_round = (
+            filtered_submissions.groupby("Round Name", observed=True, sort=False)
+            .agg(Comment_Count=("has_comment", "sum"))
+            .reset_index()
+        )
 
-            fig = px.bar(
+        st.plotly_chart(
+            build_bar_fig(
                 comments_per_round,
-                x="Name",
+                x="Round Name",
                 y="Comment_Count",
                 title="Comments per Round",
-                color="Comment_Count",
-                color_continuous_scale="viridis",
-            )
-            fig.update_layout(xaxis_tickangle=-45, height=400)
-            st.plotly_chart(fig, use_container_width=True)
-
-        with col2:
-            # Comment length distribution
-            comment_lengths = filtered_submissions[
-                filtered_submissions["Comment"].notna()
-                & (filtered_submissions["Comment"] != "")
-            ]["Comment"].str.len()
-            fig = px.histogram(
-                x=comment_lengths,
-                title="Comment Length Distribution",
-                nbins=20,
-                color_discrete_sequence=["#ff7f0e"],
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
-
-        # Most active commenters
-        st.subheader("💭 Most Active Commenters")
+                colorscale="viridis",
+            ),
+            use_container_width=True,
+        )
 
-        # Simple approach: get competitor names by looking up each Submitter ID
-        submissions_with_comments = filtered_submissions[
-            filtered_submissions["Comment"].notna()
-            & (filtered_submissions["Comment"] != "")
-        ]
+    with col2:
+        # Comment length distribution
+        st.plotly_chart(
+            build_histogram_fig(
+                comment_lengths,
+                "Comment Length Distribution",
+                20,
+                "#ff7f0e",
+                "Comment length (chars)",
+            ),
+            use_container_width=True,
+        )
 
-        commenter_names = []
-        for _, submission in submissions_with_comments.iterrows():
-            submitter_id = submission["Submitter ID"]
-            # Find the competitor with this ID
-            competitor = competitors[competitors["ID"] == submitter_id]
-            if len(competitor) > 0:
-                commenter_names.append(competitor.iloc[0]["Name"])
-            else:
-                commenter_names.append(f"Unknown ({submitter_id})")
-
-        # Create a simple series for top commenters
-        if commenter_names:
-            top_commenters = pd.Series(commenter_names).value_counts().head(10)
-            st.success("Successfully retrieved competitor names")
-        else:
-            st.warning("No comments found")
-            top_commenters = pd.Series()
+    # Most active commenters
+    st.subheader("💭 Most Active Commenters")
+
+    submissions_with_comments = filtered_submissions[
+        filtered_submissions["has_comment"]
+    ]
+
+    # Resolve commenter names with a single join on Submitter ID
+    named_comments = submissions_with_comments.merge(
+        competitors[["ID", "Name"]].rename(
+            columns={"ID": "Submitter ID", "Name": "Commenter"}
+        ),
+        on="Submitter ID",
+        how="left",
+        validate="m:1",
+    )
 
-        # Remove old code that references undefined 'commenters' variable
-        # Convert to dataframe for Plotly
-        top_commenters_df = pd.DataFrame(
-            {"Name": top_commenters.index, "Count": top_commenters.values}
+    if len(named_comments) > 0:
+        top_commenters = (
+            named_comments["Commenter"]
+            .astype(object)
+            .fillna("Unknown")
+            .value_counts()
+            .head(10)
         )
-        fig = px.bar(
+        st.success("Successfully retrieved competitor names")
+    else:
+        st.warning("No comments found")
+        top_commenters = pd.Series()
+
+    # Convert to dataframe for Plotly
+    top_commenters_df = pd.DataFrame(
+        {"Name": top_commenters.index, "Count": top_commenters.values}
+    )
+    st.plotly_chart(
+        build_bar_fig(
             top_commenters_df,
             x="Count",
             y="Name",
-            orientation="h",
             title="Top 10 Commenters",
-            color="Count",
-            color_continuous_scale="plasma",
-        )
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
-
-        # Sample comments
-        st.subheader("📝 Sample Comments")
-        # Get comments first, then sample
-        comments_only = filtered_submissions[
-            filtered_submissions["Comment"].notna()
-            & (filtered_submissions["Comment"] != "")
-        ]
-        if len(comments_only) > 0:
-            sample_size = min(5, len(comments_only))
-            sample_comments = comments_only.sample(sample_size)
-
-            for _, row in sample_comments.iterrows():
-                with st.expander(f"🎵 {row['Title']} - {row['Artist(s)']}"):
-                    st.write(f"**Comment:** {row['Comment']}")
-                    # Get round name from the submissions_with_rounds data
-                    round_name = (
-                        submissions_with_rounds[
-                            submissions_with_rounds["Spotify URI"] == row["Spotify URI"]
-                        ]["Name"].iloc[0]
-                        if len(
-                            submissions_with_rounds[
-                                submissions_with_rounds["Spotify URI"]
-                                == row["Spotify URI"]
-                            ]
-                        )
-                        > 0
-                        else "Unknown Round"
-                    )
-                    st.write(f"**Round:** {round_name}")
-        else:
-            st.info("No comments found for the selected filters.")
-
-    with tab4:
-        st.header("🎯 Round-Specific Insights")
-
-        if selected_round == "All Rounds":
-            st.info(
-                "Select a specific round from the sidebar to see detailed insights."
-            )
-
-            # Show round comparison
-            round_stats = []
-            for _, round_data in rounds.iterrows():
-                round_submissions = submissions[
-                    submissions["Round ID"] == round_data["ID"]
-                ]
-                round_votes = votes[votes["Round ID"] == round_data["ID"]]
-
-                stats = {
-                    "Round": round_data["Name"],
-                    "Submissions": len(round_submissions),
-                    "Total Votes": len(round_votes),
-                    "Avg Points": round_votes["Points Assigned"].mean(),
-                    "Comments": len(
-                        round_submissions[
-                            round_submissions["Comment"].notna()
-                            & (round_submissions["Comment"] != "")
-                        ]
-                    ),
-                }
-                round_stats.append(stats)
+            colorscale="plasma",
+            orientation="h",
+        ),
+        use_container_width=True,
+    )
 
-            round_df = pd.DataFrame(round_stats)
+    # Sample comments
+    st.subheader("📝 Sample Comments")
+    # Get comments first, then sample
+    comments_only = filtered_submissions[filtered_submissions["has_comment"]]
+    if len(comments_only) > 0:
+        sample_size = min(5, len(comments_only))
+        sample_comments = comments_only.sample(sample_size)
+
+        for _, row in sample_comments.iterrows():
+            with st.expander(f"🎵 {row['Title']} - {row['Artist(s)']}"):
+                st.write(f"**Comment:** {row['Comment']}")
+                # Submissions already carry their round name from load_data
+                round_name = (
+                    row["Round Name"]
+                    if pd.notna(row["Round Name"])
+                    else "Unknown Round"
+                )
+                st.write(f"**Round:** {round_name}")
+    else:
+        st.info("No comments found for the selected filters.")
+
+
+def render_round_insights(
+    rounds, submissions, votes, competitor_name_by_id, selected_round, round_id
+):
+    """Render the round insights section"""
+    st.header("🎯 Round-Specific Insights")
+
+    if selected_round == "All Rounds":
+        st.info("Select a specific round from the sidebar to see detailed insights.")
+
+        # Show round comparison, aggregated in one pass per table
+        round_submission_stats = submissions.groupby(
+            "Round ID", observed=True, sort=False
+        ).agg(Submissions=("Spotify URI", "size"), Comments=("has_comment", "sum"))
+        round_vote_stats = votes.groupby("Round ID", observed=True, sort=False)[
+            "Points Assigned"
+        ].agg([("Total Votes", "size"), ("Avg Points", "mean")])
+
+        round_df = (
+            rounds[["ID", "Name"]]
+            .merge(round_submission_stats, left_on="ID", right_index=True, how="left")
+            .merge(round_vote_stats, left_on="ID", right_index=True, how="left")
+            .rename(columns={"Name": "Round"})
+            .fillna({"Submissions": 0, "Comments": 0, "Total Votes": 0})
+            .astype({"Submissions": int, "Comments": int, "Total Votes": int})
+        )
 
-            col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
 
-            with col1:
-                fig = px.bar(
+        with col1:
+            st.plotly_chart(
+                build_bar_fig(
                     round_df,
                     x="Round",
                     y="Submissions",
                     title="Submissions per Round",
-                    color="Submissions",
-                    color_continuous_scale="viridis",
-                )
-                fig.update_layout(xaxis_tickangle=-45, height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                    colorscale="viridis",
+                ),
+                use_container_width=True,
+            )
 
-            with col2:
-                fig = px.bar(
+        with col2:
+            st.plotly_chart(
+                build_bar_fig(
                     round_df,
                     x="Round",
                     y="Total Votes",
                     title="Total Votes per Round",
-                    color="Total Votes",
-                    color_continuous_scale="plasma",
-                )
-                fig.update_layout(xaxis_tickangle=-45, height=400)
-                st.plotly_chart(fig, use_container_width=True)
-
-        else:
-            # Round-specific analysis
-            st.subheader(f"📊 Analysis for: {selected_round}")
+                    colorscale="plasma",
+                ),
+                use_container_width=True,
+            )
 
-            round_id = rounds[rounds["Name"] == selected_round]["ID"].iloc[0]
-            round_submissions = submissions[submissions["Round ID"] == round_id]
-            round_votes = votes[votes["Round ID"] == round_id]
+    else:
+        # Round-specific analysis
+        st.subheader(f"📊 Analysis for: {selected_round}")
 
-            # Round metrics
-            col1, col2, col3, col4 = st.columns(4)
+        round_submissions = submissions[submissions["Round ID"] == round_id]
+        round_votes = votes[votes["Round ID"] == round_id]
 
-            with col1:
-                st.metric("Submissions", len(round_submissions))
+        # Round metrics
+        col1, col2, col3, col4 = st.columns(4)
 
-            with col2:
-                st.metric("Total Votes", len(round_votes))
+        with col1:
+            st.metric("Submissions", len(round_submissions))
 
-            with col3:
-                st.metric("Avg Points", f"{round_votes['Points Assigned'].mean():.2f}")
+        with col2:
+            st.metric("Total Votes", len(round_votes))
 
-            with col4:
-                comment_count = len(
-                    round_submissions[
-                        round_submissions["Comment"].notna()
-                        & (round_submissions["Comment"] != "")
-                    ]
-                )
-                st.metric("Comments", comment_count)
+        with col3:
+            st.metric("Avg Points", f"{round_votes['Points Assigned'].mean():.2f}")
 
-            # Top submissions by points
-            st.subheader("🏆 Top Submissions by Points")
-            submission_points = (
-                round_votes.groupby("Spotify URI")["Points Assigned"]
-                .sum()
-                .reset_index()
-            )
-            submission_points = submission_points.merge(
-                round_submissions[["Spotify URI", "Title", "Artist(s)", "Comment"]],
-                on="Spotify URI",
-            ).sort_values("Points Assigned", ascending=False)
+        with col4:
+            comment_count = int(round_submissions["has_comment"].sum())
+            st.metric("Comments", comment_count)
+
+        # Top submissions by points
+        st.subheader("🏆 Top Submissions by Points")
+        submission_points = (
+            round_votes.groupby("Spotify URI", observed=True, sort=False)[
+                "Points Assigned"
+            ]
+            .sum()
+            .reset_index()
+        )
+        submission_points = submission_points.merge(
+            round_submissions[["Spotify URI", "Title", "Artist(s)", "Comment"]],
+            on="Spotify URI",
+        ).sort_values("Points Assigned", ascending=False)
 
-            fig = px.bar(
-                submission_points.head(10),
+        st.plotly_chart(
+            build_bar_fig(
+                shorten_comments(submission_points.head(10)),
                 x="Points Assigned",
                 y="Title",
-                orientation="h",
                 title="Top 10 Submissions by Total Points",
-                color="Points Assigned",
-                color_continuous_scale="viridis",
+                colorscale="viridis",
+                orientation="h",
+                height=500,
                 hover_data=["Artist(s)", "Comment"],
+            ),
+            use_container_width=True,
+        )
+
+        # Voting distribution
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.plotly_chart(
+                build_histogram_fig(
+                    round_votes["Points Assigned"],
+                    "Points Distribution",
+                    10,
+                    "#1f77b4",
+                    "Points Assigned",
+                ),
+                use_container_width=True,
+            )
+
+        with col2:
+            # Voter participation
+            votes_cast = round_votes["Voter ID"].value_counts()
+            # Categorical value_counts also lists voters absent from this round
+            votes_cast = votes_cast[votes_cast > 0]
+            voter_participation = pd.DataFrame(
+                {
+                    "Name": votes_cast.index.map(competitor_name_by_id),
+                    "Votes_Cast": votes_cast.to_numpy(),
+                }
             )
-            fig.update_layout(height=500)
-            st.plotly_chart(fig, use_container_width=True)
-
-            # Voting distribution
-            col1, col2 = st.columns(2)
-
-            with col1:
-                fig = px.histogram(
-                    round_votes,
-                    x="Points Assigned",
-                    title="Points Distribution",
-                    nbins=10,
-                    color_discrete_sequence=["#1f77b4"],
-                )
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
-
-            with col2:
-                # Voter participation
-                voter_participation = (
-                    round_votes.groupby("Voter ID")
-                    .size()
-                    .reset_index(name="Votes_Cast")
-                )
-                # Debug: Check voter participation columns
-                voter_participation = voter_participation.merge(
-                    competitors[["ID", "Name"]],
-                    left_on="Voter ID",
-                    right_on="ID",
-                    how="left",
-                )
 
-                fig = px.bar(
+            st.plotly_chart(
+                build_bar_fig(
                     voter_participation,
                     x="Name",
                     y="Votes_Cast",
                     title="Voter Participation",
-                    color="Votes_Cast",
-                    color_continuous_scale="plasma",
-                )
-                fig.update_layout(xaxis_tickangle=-45, height=400)
-                st.plotly_chart(fig, use_container_width=True)
-
-    with tab5:
-        st.header("👥 Competitor Statistics")
-
-        if selected_competitor == "All Competitors":
-            st.info(
-                "Select a specific competitor from the sidebar to see detailed stats."
+                    colorscale="plasma",
+                ),
+                use_container_width=True,
             )
 
-            # Overall competitor rankings
-            competitor_stats = []
-
-            for _, competitor in competitors.iterrows():
-                # Submissions
-                comp_submissions = submissions[
-                    submissions["Submitter ID"] == competitor["ID"]
-                ]
-                submission_count = len(comp_submissions)
-
-                # Votes received
-                comp_votes = votes.merge(
-                    submissions[["Spotify URI", "Submitter ID"]], on="Spotify URI"
-                )
-                comp_votes = comp_votes[comp_votes["Submitter ID"] == competitor["ID"]]
-                total_points_received = comp_votes["Points Assigned"].sum()
-                avg_points_received = (
-                    comp_votes["Points Assigned"].mean() if len(comp_votes) > 0 else 0
-                )
-
-                # Voting activity
-                comp_voting = votes[votes["Voter ID"] == competitor["ID"]]
-                voting_count = len(comp_voting)
-                avg_points_given = (
-                    comp_voting["Points Assigned"].mean() if voting_count > 0 else 0
-                )
-
-                # Comments
-                comment_count = len(
-                    comp_submissions[
-                        comp_submissions["Comment"].notna()
-                        & (comp_submissions["Comment"] != "")
-                    ]
-                )
 
-                stats = {
-                    "Name": competitor["Name"],
-                    "Submissions": submission_count,
-                    "Points Received": total_points_received,
-                    "Avg Points Received": avg_points_received,
-                    "Votes Cast": voting_count,
-                    "Avg Points Given": avg_points_given,
-                    "Comments": comment_count,
+def render_competitor_stats(
+    competitors,
+    submissions,
+    votes,
+    votes_with_voters,
+    votes_with_submitter,
+    selected_competitor,
+    competitor_id,
+):
+    """Render the competitor statistics section"""
+    st.header("👥 Competitor Statistics")
+
+    if selected_competitor == "All Competitors":
+        st.info("Select a specific competitor from the sidebar to see detailed stats.")
+
+        # Overall competitor rankings, aggregated in one pass per table
+        submission_stats = submissions.groupby(
+            "Submitter ID", observed=True, sort=False
+        ).agg(
+            Submissions=("Spotify URI", "size"),
+            Comments=("has_comment", "sum"),
+        )
+        received_stats = votes_with_submitter.groupby(
+            "Submitter ID", observed=True, sort=False
+        )["Points Assigned"].agg(
+            [("Points Received", "sum"), ("Avg Points Received", "mean")]
+        )
+        cast_stats = votes.groupby("Voter ID", observed=True, sort=False)[
+            "Points Assigned"
+        ].agg([("Votes Cast", "size"), ("Avg Points Given", "mean")])
+
+        comp_df = (
+            competitors.set_index("ID")
+            .join([submission_stats, received_stats, cast_stats])
+            .fillna(
+                {
+                    "Submissions": 0,
+                    "Comments": 0,
+                    "Points Received": 0,
+                    "Avg Points Received": 0,
+                    "Votes Cast": 0,
+                    "Avg Points Given": 0,
                 }
-                competitor_stats.append(stats)
-
-            comp_df = pd.DataFrame(competitor_stats)
+            )
+            .astype(
+                {
+                    "Submissions": int,
+                    "Comments": int,
+                    "Points Received": int,
+                    "Votes Cast": int,
+                }
+            )
+            .reset_index()
+        )
 
-            # Top competitors by different metrics
-            col1, col2 = st.columns(2)
+        # Top competitors by different metrics
+        col1, col2 = st.columns(2)
 
-            with col1:
-                top_submitters = comp_df.nlargest(10, "Submissions")
-                fig = px.bar(
+        with col1:
+            top_submitters = comp_df.nlargest(10, "Submissions")
+            st.plotly_chart(
+                build_bar_fig(
                     top_submitters,
                     x="Submissions",
                     y="Name",
-                    orientation="h",
                     title="Top 10 Submitters",
-                    color="Submissions",
-                    color_continuous_scale="viridis",
-                )
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                    colorscale="viridis",
+                    orientation="h",
+                ),
+                use_container_width=True,
+            )
 
-            with col2:
-                top_point_receivers = comp_df.nlargest(10, "Points Received")
-                fig = px.bar(
+        with col2:
+            top_point_receivers = comp_df.nlargest(10, "Points Received")
+            st.plotly_chart(
+                build_bar_fig(
                     top_point_receivers,
                     x="Points Received",
                     y="Name",
-                    orientation="h",
                     title="Top 10 Point Receivers",
-                    color="Points Received",
-                    color_continuous_scale="plasma",
-                )
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
-
-            # Scatter plot: Submissions vs Points Received
-            fig = px.scatter(
-                comp_df,
-                x="Submissions",
-                y="Points Received",
-                title="Submissions vs Points Received",
-                hover_data=["Name", "Avg Points Received"],
-                size="Comments",
-                color="Votes Cast",
-                color_continuous_scale="viridis",
+                    colorscale="plasma",
+                    orientation="h",
+                ),
+                use_container_width=True,
             )
-            fig.update_layout(height=500)
-            st.plotly_chart(fig, use_container_width=True)
 
-        else:
-            # Individual competitor analysis
-            st.subheader(f"👤 Analysis for: {selected_competitor}")
+        # Scatter plot: Submissions vs Points Received
+        fig = px.scatter(
+            comp_df,
+            x="Submissions",
+            y="Points Received",
+            title="Submissions vs Points Received",
+            hover_data=["Name", "Avg Points Received"],
+            size="Comments",
+            color="Votes Cast",
+            color_continuous_scale="viridis",
+        )
+        fig.update_layout(height=500)
+        st.plotly_chart(fig, use_container_width=True)
 
-            competitor_id = competitors[competitors["Name"] == selected_competitor][
-                "ID"
-            ].iloc[0]
+    else:
+        # Individual competitor analysis
+        st.subheader(f"👤 Analysis for: {selected_competitor}")
 
-            # Competitor metrics
-            comp_submissions = submissions[submissions["Submitter ID"] == competitor_id]
-            comp_votes_received = votes.merge(
-                submissions[["Spotify URI", "Submitter ID"]], on="Spotify URI"
-            )
-            comp_votes_received = comp_votes_received[
-                comp_votes_received["Submitter ID"] == competitor_id
-            ]
-            comp_votes_cast = votes[votes["Voter ID"] == competitor_id]
+        # Competitor metrics
+        comp_submissions = submissions[submissions["Submitter ID"] == competitor_id]
+        comp_votes_received = votes_with_submitter[
+            votes_with_submitter["Submitter ID"] == competitor_id
+        ]
+        comp_votes_cast = votes[votes["Voter ID"] == competitor_id]
+
+        col1, col2, col3, col4 = st.columns(4)
 
-            col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Submissions", len(comp_submissions))
 
-            with col1:
-                st.metric("Submissions", len(comp_submissions))
+        with col2:
+            st.metric("Points Received", comp_votes_received["Points Assigned"].sum())
 
-            with col2:
-                st.metric(
-                    "Points Received", comp_votes_received["Points Assigned"].sum()
-                )
+        with col3:
+            st.metric("Votes Cast", len(comp_votes_cast))
 
-            with col3:
-                st.metric("Votes Cast", len(comp_votes_cast))
+        with col4:
+            comment_count = int(comp_submissions["has_comment"].sum())
+            st.metric("Comments", comment_count)
+
+        # Submission performance
+        st.subheader("📊 Submission Performance")
+        submission_performance = comp_submissions.merge(
+            comp_votes_received.groupby("Spotify URI", observed=True, sort=False)[
+                "Points Assigned"
+            ]
+            .sum()
+            .reset_index(name="Total_Points"),
+            on="Spotify URI",
+            how="left",
+        ).fillna({"Total_Points": 0})
 
-            with col4:
-                comment_count = len(
-                    comp_submissions[
-                        comp_submissions["Comment"].notna()
-                        & (comp_submissions["Comment"] != "")
-                    ]
-                )
-                st.metric("Comments", comment_count)
-
-            # Submission performance
-            st.subheader("📊 Submission Performance")
-            submission_performance = comp_submissions.merge(
-                comp_votes_received.groupby("Spotify URI")["Points Assigned"]
-                .sum()
-                .reset_index(name="Total_Points"),
-                on="Spotify URI",
-                how="left",
-            ).fillna(0)
-
-            fig = px.bar(
-                submission_performance,
+        st.plotly_chart(
+            build_bar_fig(
+                shorten_comments(submission_performance),
                 x="Title",
                 y="Total_Points",
                 title="Points Received per Submission",
-                color="Total_Points",
-                color_continuous_scale="viridis",
+                colorscale="viridis",
                 hover_data=["Artist(s)", "Comment"],
+            ),
+            use_container_width=True,
+        )
+
+        # Voting behavior
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.plotly_chart(
+                build_histogram_fig(
+                    comp_votes_cast["Points Assigned"],
+                    "Voting Distribution",
+                    10,
+                    "#ff7f0e",
+                    "Points Assigned",
+                ),
+                use_container_width=True,
             )
-            fig.update_layout(xaxis_tickangle=-45, height=400)
-            st.plotly_chart(fig, use_container_width=True)
-
-            # Voting behavior
-            col1, col2 = st.columns(2)
-
-            with col1:
-                fig = px.histogram(
-                    comp_votes_cast,
-                    x="Points Assigned",
-                    title="Voting Distribution",
-                    nbins=10,
-                    color_discrete_sequence=["#ff7f0e"],
-                )
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
-
-            with col2:
-                # Voting by round
-                # Get votes with round information by merging with the full votes_with_voters data
-                comp_votes_with_rounds = votes_with_voters[
-                    votes_with_voters["Voter ID"] == competitor_id
+
+        with col2:
+            # Voting by round
+            # Get votes with round information by merging with the full votes_with_voters data
+            comp_votes_with_rounds = votes_with_voters[
+                votes_with_voters["Voter ID"] == competitor_id
+            ]
+            voting_by_round = (
+                comp_votes_with_rounds.groupby("Round Name", observed=True, sort=False)[
+                    "Points Assigned"
                 ]
-                voting_by_round = (
-                    comp_votes_with_rounds.groupby("Name")["Points Assigned"]
-                    .agg(["mean", "count"])
-                    .reset_index()
-                )
-                voting_by_round.columns = ["Round", "Avg Points", "Votes Cast"]
+                .agg(["mean", "count"])
+                .reset_index()
+            )
+            voting_by_round.columns = ["Round", "Avg Points", "Votes Cast"]
 
-                fig = px.bar(
+            st.plotly_chart(
+                build_bar_fig(
                     voting_by_round,
                     x="Round",
                     y="Avg Points",
                     title="Average Points Given by Round",
+                    colorscale="plasma",
                     color="Votes Cast",
-                    color_continuous_scale="plasma",
-                )
-                fig.update_layout(xaxis_tickangle=-45, height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                ),
+                use_container_width=True,
+            )
+
+
+def main():
+    # Header
+    st.markdown(
+        '<h1 class="main-header">🎵 Lo Fi Peeps Music League Analytics</h1>',
+        unsafe_allow_html=True,
+    )
+
+    # Load data
+    (
+        competitors,
+        rounds,
+        submissions,
+        votes,
+        votes_with_voters,
+        submissions_with_rounds,
+        votes_with_submitter,
+        round_id_by_name,
+        competitor_id_by_name,
+        competitor_name_by_id,
+        top_artists_df,
+    ) = load_data()
+
+    if competitors is None:
+        st.error("Failed to load data. Please check your CSV files.")
+        return
+
+    # Sidebar filters
+    st.sidebar.header("📊 Filters")
+
+    # Round filter, with options taken from the cached lookup tables
+    round_names = ["All Rounds", *round_id_by_name]
+    selected_round = st.sidebar.selectbox("Select Round", round_names)
+
+    # Competitor filter
+    competitor_names = ["All Competitors", *competitor_id_by_name]
+    selected_competitor = st.sidebar.selectbox("Select Competitor", competitor_names)
+
+    # Apply filters
+    round_id = (
+        round_id_by_name[selected_round] if selected_round != "All Rounds" else None
+    )
+    competitor_id = (
+        competitor_id_by_name[selected_competitor]
+        if selected_competitor != "All Competitors"
+        else None
+    )
+
+    if round_id is None and competitor_id is None:
+        filtered_votes = votes_with_voters
+    else:
+        filtered_votes = select_votes(load_votes_index(), round_id, competitor_id)
+
+    filtered_submissions = submissions_with_rounds
+    if round_id is not None:
+        filtered_submissions = filtered_submissions[
+            filtered_submissions["Round ID"] == round_id
+        ]
+    if competitor_id is not None:
+        filtered_submissions = filtered_submissions[
+            filtered_submissions["Submitter ID"] == competitor_id
+        ]
+
+    # Only the selected section is computed on each rerun
+    section = st.radio(
+        "Section",
+        [
+            "📈 Overview",
+            "🗳️ Voting Patterns",
+            "💬 Comments Analysis",
+            "🎯 Round Insights",
+            "👥 Competitor Stats",
+        ],
+        horizontal=True,
+        label_visibility="collapsed",
+    )
+
+    if section == "📈 Overview":
+        render_overview(
+            competitors,
+            rounds,
+            submissions,
+            votes,
+            submissions_with_rounds,
+            top_artists_df,
+        )
+    elif section == "🗳️ Voting Patterns":
+        render_voting_patterns(filtered_votes, votes_with_voters, selected_round)
+    elif section == "💬 Comments Analysis":
+        render_comments(filtered_submissions, competitors)
+    elif section == "🎯 Round Insights":
+        render_round_insights(
+            rounds, submissions, votes, competitor_name_by_id, selected_round, round_id
+        )
+    else:
+        render_competitor_stats(
+            competitors,
+            submissions,
+            votes,
+            votes_with_voters,
+            votes_with_submitter,
+            selected_competitor,
+            competitor_id,
+        )
 
     # Footer
     st.markdown("---")
@@ -0,0 +1,24 @@
+"""Convert the Music League CSV exports in data/ to Parquet for faster loading"""
+
+from pathlib import Path
+
+import pandas as pd
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def main():
+    for csv_path in sorted(DATA_DIR.glob("*.csv")):
+        df = pd.read_csv(csv_path)
+
+        # Store timestamps typed so the dashboard doesn't have to parse them
+        if "Created" in df.columns:
+            df["Created"] = pd.to_datetime(df["Created"])
+
+        parquet_path = csv_path.with_suffix(".parquet")
+        df.to_parquet(parquet_path, index=False)
+        print(f"Wrote {parquet_path.relative_to(DATA_DIR.parent)}")
+
+
+if __name__ == "__main__":
+    main()